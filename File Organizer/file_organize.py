@@ -12,23 +12,49 @@ Industrial-Grade File Organizer with:
 
 import os
 import shutil
+import errno
 import sys
 import logging
+import logging.handlers
+import atexit
+import queue
+import threading
 import argparse
 import json
 import time
 import hashlib
+import ctypes
+import mmap
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from enum import Enum, auto
 
+try:
+    import blake3  # Optional: much faster content hashing
+except ImportError:
+    blake3 = None
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
+
 # Constants
 DEFAULT_CONFIG_FILE = "file_organizer_config.json"
 DEFAULT_LOG_FILE = "file_organizer.log"
+DEFAULT_REPORT_FILE = "file_organizer_report.jsonl"
 MAX_WORKERS = 4
-BUFFER_SIZE = 65536  # 64KB chunks for hashing
+ASYNC_CONCURRENCY = 64  # Moves in flight in --async mode
+SINGLE_SHOT_THRESHOLD = 8 << 20  # Files below 8MB are hashed, larger ones compared via mmap
+EDGE_COMPARE_SIZE = 4096  # Bytes compared at each end before full hashing
+MMAP_COMPARE_WINDOW = 1 << 20  # 1MB windows when comparing mapped files
+DEFAULT_HASH_ALGORITHM = "blake3" if blake3 else "sha256"
+FICLONE = 0x40049409  # Linux ioctl for copy-on-write clones
+CLONE_NOFOLLOW = 0x0001  # macOS clonefile(3) flag
+_libc = ctypes.CDLL(None, use_errno=True) if sys.platform == "darwin" else None
 
 class FileCategory(Enum):
     IMAGES = auto()
@@ -46,15 +72,26 @@ class ConflictResolution(Enum):
     OVERWRITE = auto()
     SKIP = auto()
 
-@dataclass
+class Action(Enum):
+    MOVED = "Moved"
+    RENAMED = "Renamed"
+    OVERWRITTEN = "Overwritten"
+    SKIPPED = "Skipped"
+    SKIPPED_IDENTICAL = "Skipped (identical)"
+    WOULD_RESOLVE_CONFLICT = "Would resolve conflict"
+
+MOVED_ACTIONS = (Action.MOVED, Action.RENAMED, Action.OVERWRITTEN)
+SKIPPED_ACTIONS = (Action.SKIPPED, Action.SKIPPED_IDENTICAL)
+
+@dataclass(slots=True)
 class FileOperation:
-    source: Path
-    destination: Path
-    action: str
+    source: str
+    destination: Optional[str]
+    action: Optional[Action] = None
     success: bool = False
     error: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class OrganizerStats:
     total_files: int = 0
     processed_files: int = 0
@@ -74,33 +111,52 @@ class FileOrganizer:
         self.base_dir = base_dir.resolve()
         self.config_file = config_file or Path(DEFAULT_CONFIG_FILE)
         self.stats = OrganizerStats()
-        self.operations: List[FileOperation] = []
+        self.report_file = Path(DEFAULT_REPORT_FILE).resolve()
+        self.folder_names: Dict[str, Set[str]] = {}
+        self._names_lock = threading.Lock()
+        self._prompt_lock = threading.Lock()
+        self.missing_folders: Set[FileCategory] = set()
+        self.action_counts: Dict[Action, int] = dict.fromkeys(Action, 0)
+        self.hash_algorithm = DEFAULT_HASH_ALGORITHM
         self._setup_logging()
-        self._load_config()
         
-        # Initialize default extensions if not in config
+        # Initialize default extensions, overridden by config below
         self.extensions = {
-            FileCategory.IMAGES: {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp'},
-            FileCategory.VIDEOS: {'.mp4', '.mkv', '.avi', '.mov', '.wmv', '.flv', '.webm'},
-            FileCategory.DOCUMENTS: {'.pdf', '.doc', '.docx', '.odt', '.txt', '.rtf', '.xls', '.xlsx', '.ppt', '.pptx'},
-            FileCategory.MUSIC: {'.mp3', '.wav', '.flac', '.aac', '.ogg', '.wma'},
-            FileCategory.ARCHIVES: {'.zip', '.rar', '.7z', '.tar', '.gz', '.bz2'},
-            FileCategory.DATA: {'.csv', '.json', '.xml', '.sql', '.db', '.sqlite'},
-            FileCategory.CODE: {'.py', '.js', '.html', '.css', '.java', '.c', '.cpp', '.h', '.sh', '.php'},
-            FileCategory.EXECUTABLES: {'.exe', '.msi', '.dmg', '.pkg', '.deb', '.rpm', '.apk'},
+            FileCategory.IMAGES: frozenset({'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp'}),
+            FileCategory.VIDEOS: frozenset({'.mp4', '.mkv', '.avi', '.mov', '.wmv', '.flv', '.webm'}),
+            FileCategory.DOCUMENTS: frozenset({'.pdf', '.doc', '.docx', '.odt', '.txt', '.rtf', '.xls', '.xlsx', '.ppt', '.pptx'}),
+            FileCategory.MUSIC: frozenset({'.mp3', '.wav', '.flac', '.aac', '.ogg', '.wma'}),
+            FileCategory.ARCHIVES: frozenset({'.zip', '.rar', '.7z', '.tar', '.gz', '.bz2'}),
+            FileCategory.DATA: frozenset({'.csv', '.json', '.xml', '.sql', '.db', '.sqlite'}),
+            FileCategory.CODE: frozenset({'.py', '.js', '.html', '.css', '.java', '.c', '.cpp', '.h', '.sh', '.php'}),
+            FileCategory.EXECUTABLES: frozenset({'.exe', '.msi', '.dmg', '.pkg', '.deb', '.rpm', '.apk'}),
         }
+        self._load_config()
+        self._build_extension_index()
 
     def _setup_logging(self):
-        """Configure logging system"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(DEFAULT_LOG_FILE),
-                logging.StreamHandler()
-            ]
-        )
+        """Configure logging system
+        
+        Records are passed through a queue so that file and console output is
+        written by a single listener thread instead of by every worker.
+        """
         self.logger = logging.getLogger(__name__)
+        if logging.getLogger().handlers:
+            return
+        
+        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+        handlers = [logging.FileHandler(DEFAULT_LOG_FILE), logging.StreamHandler()]
+        for handler in handlers:
+            handler.setFormatter(formatter)
+        
+        log_queue = queue.Queue()
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setFormatter(logging.Formatter('%(message)s'))
+        logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
+        
+        listener = logging.handlers.QueueListener(log_queue, *handlers)
+        listener.start()
+        atexit.register(listener.stop)
 
     def _load_config(self):
         """Load configuration from JSON file"""
@@ -112,9 +168,12 @@ class FileOrganizer:
                         for category, exts in config['extensions'].items():
                             try:
                                 enum_category = FileCategory[category.upper()]
-                                self.extensions[enum_category] = set(exts)
+                                self.extensions[enum_category] = frozenset(sys.intern(ext) for ext in exts)
                             except KeyError:
                                 self.logger.warning(f"Unknown category '{category}' in config")
+                    algorithm = config.get('options', {}).get('hash_algorithm')
+                    if algorithm:
+                        self._set_hash_algorithm(algorithm.lower())
         except Exception as e:
             self.logger.error(f"Failed to load config: {str(e)}")
 
@@ -132,140 +191,311 @@ class FileOrganizer:
         except Exception as e:
             self.logger.error(f"Failed to save config: {str(e)}")
 
-    def _get_file_category(self, file_path: Path) -> FileCategory:
-        """Determine the category of a file based on its extension"""
-        ext = file_path.suffix.lower()
+    def _build_extension_index(self):
+        """Build the extension -> category lookup table"""
+        self.ext_to_category: Dict[str, FileCategory] = {}
         for category, exts in self.extensions.items():
-            if ext in exts:
-                return category
-        return FileCategory.UNKNOWN
+            for ext in exts:
+                # First category wins when an extension is listed twice
+                self.ext_to_category.setdefault(sys.intern(ext), category)
 
-    def _get_target_folder(self, category: FileCategory) -> Path:
+    def _get_file_category(self, file_path: str) -> FileCategory:
+        """Determine the category of a file based on its extension"""
+        ext = os.path.splitext(file_path)[1].lower()
+        return self.ext_to_category.get(ext, FileCategory.UNKNOWN)
+
+    def _categorize_files(self, names: Iterable[str]) -> List[FileCategory]:
+        """Determine the categories of a batch of file names in a single pass"""
+        lookup = self.ext_to_category.get
+        unknown = FileCategory.UNKNOWN
+        # str.rfind and slicing stay in C, unlike os.path.splitext. A dot at
+        # position 0 marks a hidden file, not an extension.
+        return [
+            lookup(name[dot:].lower(), unknown) if (dot := name.rfind('.')) > 0 else unknown
+            for name in names
+        ]
+
+    def _get_target_folder(self, category: FileCategory) -> str:
         """Get the target folder path for a given category"""
         folder_name = category.name.title()
-        return self.base_dir / folder_name
+        return os.path.join(self.base_dir, folder_name)
+
+    def _set_hash_algorithm(self, algorithm: str):
+        """Select the content hash algorithm, falling back to SHA256"""
+        if algorithm == "auto":
+            algorithm = DEFAULT_HASH_ALGORITHM
+        elif algorithm == "blake3" and blake3 is None:
+            self.logger.warning("blake3 is not installed, falling back to sha256")
+            algorithm = "sha256"
+        elif algorithm != "blake3" and algorithm not in hashlib.algorithms_available:
+            self.logger.warning(f"Unknown hash algorithm '{algorithm}', falling back to sha256")
+            algorithm = "sha256"
+        self.hash_algorithm = algorithm
 
-    def _calculate_hash(self, file_path: Path) -> str:
-        """Calculate SHA256 hash of a file"""
-        sha256 = hashlib.sha256()
+    def _new_hasher(self):
+        """Create a hash object for the configured algorithm"""
+        if self.hash_algorithm == "blake3":
+            return blake3.blake3(max_threads=blake3.blake3.AUTO)
+        return hashlib.new(self.hash_algorithm)
+
+    def _calculate_hash(self, file_path: str) -> str:
+        """Calculate the content hash of a file in a single read
+        
+        Only used for files below SINGLE_SHOT_THRESHOLD; larger files are
+        compared with _compare_mapped instead.
+        """
+        hasher = self._new_hasher()
         with open(file_path, 'rb') as f:
-            while True:
-                data = f.read(BUFFER_SIZE)
-                if not data:
-                    break
-                sha256.update(data)
-        return sha256.hexdigest()
+            hasher.update(f.read())
+        return hasher.hexdigest()
 
-    def _resolve_conflict(self, source: Path, target: Path) -> ConflictResolution:
+    def _is_identical(self, source: str, target: str) -> bool:
+        """Check whether two files have identical content"""
+        # Files of different sizes cannot be identical
+        size = os.stat(source).st_size
+        if size != os.stat(target).st_size:
+            return False
+        
+        # Cheap check of the first and last bytes before hashing everything
+        if size > 2 * EDGE_COMPARE_SIZE:
+            with open(source, 'rb') as a, open(target, 'rb') as b:
+                if a.read(EDGE_COMPARE_SIZE) != b.read(EDGE_COMPARE_SIZE):
+                    return False
+                a.seek(-EDGE_COMPARE_SIZE, os.SEEK_END)
+                b.seek(-EDGE_COMPARE_SIZE, os.SEEK_END)
+                if a.read() != b.read():
+                    return False
+        
+        # Large files are compared directly, stopping at the first difference
+        if size >= SINGLE_SHOT_THRESHOLD:
+            return self._compare_mapped(source, target)
+        return self._calculate_hash(source) == self._calculate_hash(target)
+
+    def _compare_mapped(self, source: str, target: str) -> bool:
+        """Compare two files byte-wise through read-only memory maps"""
+        with open(source, 'rb') as a, open(target, 'rb') as b, \
+                mmap.mmap(a.fileno(), 0, access=mmap.ACCESS_READ) as map_a, \
+                mmap.mmap(b.fileno(), 0, access=mmap.ACCESS_READ) as map_b:
+            if len(map_a) != len(map_b):
+                return False
+            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                map_a.madvise(mmap.MADV_SEQUENTIAL)
+                map_b.madvise(mmap.MADV_SEQUENTIAL)
+            # Compare in windows so only a small part of each file is resident at once
+            for offset in range(0, len(map_a), MMAP_COMPARE_WINDOW):
+                end = offset + MMAP_COMPARE_WINDOW
+                if map_a[offset:end] != map_b[offset:end]:
+                    return False
+        return True
+
+    def _resolve_conflict(self, source: str, target: str) -> ConflictResolution:
         """Resolve file conflict with user interaction"""
-        self.logger.info(f"Conflict: {target.name} already exists in {target.parent}")
+        # Worker threads prompt one at a time so answers go to the right file
+        with self._prompt_lock:
+            target_dir, target_name = os.path.split(target)
+            self.logger.info(f"Conflict: {target_name} already exists in {target_dir}")
+            
+            while True:
+                try:
+                    choice = input(
+                        f"Choose action for {os.path.basename(source)}:\n"
+                        "1. Rename and move\n"
+                        "2. Overwrite if different\n"
+                        "3. Skip\n"
+                        "Enter choice (1-3): "
+                    ).strip()
+                    
+                    if choice == '1':
+                        return ConflictResolution.RENAME
+                    elif choice == '2':
+                        return ConflictResolution.OVERWRITE
+                    elif choice == '3':
+                        return ConflictResolution.SKIP
+                    else:
+                        print("Invalid choice. Please enter 1, 2, or 3")
+                except KeyboardInterrupt:
+                    self.logger.info("Operation cancelled by user")
+                    raise
+
+    def _try_reflink(self, source: str, target_path: str) -> bool:
+        """Clone a file copy-on-write (Btrfs, XFS, APFS), returning False if unsupported"""
+        if os.path.exists(target_path):
+            return False
         
-        while True:
-            try:
-                choice = input(
-                    f"Choose action for {source.name}:\n"
-                    "1. Rename and move\n"
-                    "2. Overwrite if different\n"
-                    "3. Skip\n"
-                    "Enter choice (1-3): "
-                ).strip()
-                
-                if choice == '1':
-                    return ConflictResolution.RENAME
-                elif choice == '2':
-                    return ConflictResolution.OVERWRITE
-                elif choice == '3':
-                    return ConflictResolution.SKIP
-                else:
-                    print("Invalid choice. Please enter 1, 2, or 3")
-            except KeyboardInterrupt:
-                self.logger.info("Operation cancelled by user")
+        if _libc is not None:
+            if _libc.clonefile(os.fsencode(source), os.fsencode(target_path), CLONE_NOFOLLOW) != 0:
+                return False
+            return True
+        
+        if fcntl is None:
+            return False
+        
+        try:
+            with open(source, 'rb') as src, open(target_path, 'xb') as dst:
+                try:
+                    fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+                except OSError:
+                    # EXDEV, EOPNOTSUPP, EINVAL, ...: fall back to a regular copy
+                    dst.close()
+                    os.unlink(target_path)
+                    return False
+        except OSError:
+            return False
+        shutil.copystat(source, target_path)
+        return True
+
+    def _transfer_file(self, source: str, target_path: str):
+        """Move a file, renaming in place and copying only across filesystems"""
+        try:
+            # Same filesystem: a rename only updates metadata
+            os.replace(source, target_path)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
                 raise
+            # Try a clone first (e.g. Btrfs subvolumes share extents);
+            # copy2 uses sendfile where available and keeps timestamps
+            if not self._try_reflink(source, target_path):
+                shutil.copy2(source, target_path)
+            os.unlink(source)
+
+    def _create_target_folders(self, categories: Set[FileCategory]):
+        """Create the folders for the given categories up front"""
+        for category in categories:
+            target_folder = self._get_target_folder(category)
+            try:
+                os.makedirs(target_folder, exist_ok=True)
+            except OSError as e:
+                # Retried per file in _move_file so each file records the failure
+                self.logger.warning(f"Could not create {target_folder}: {str(e)}")
+                self.missing_folders.add(category)
+
+    def _unique_name(self, target_folder: str, name: str) -> str:
+        """Pick a free '<stem>_<n><suffix>' name using a snapshot of the folder"""
+        stem, suffix = os.path.splitext(name)
+        with self._names_lock:
+            existing = self.folder_names.get(target_folder)
+            if existing is None:
+                with os.scandir(target_folder) as entries:
+                    existing = {entry.name for entry in entries}
+                self.folder_names[target_folder] = existing
+            counter = 1
+            while (new_name := f"{stem}_{counter}{suffix}") in existing:
+                counter += 1
+            # Reserve the name so other files in this run do not pick it
+            existing.add(new_name)
+        return new_name
 
-    def _move_file(self, source: Path, dry_run: bool = False) -> FileOperation:
+    def _add_folder_name(self, target_folder: str, name: str):
+        """Keep a folder snapshot in sync with files moved into it"""
+        with self._names_lock:
+            existing = self.folder_names.get(target_folder)
+            if existing is not None:
+                existing.add(name)
+
+    def _move_file(self, source: str, dry_run: bool = False,
+                   category: Optional[FileCategory] = None) -> FileOperation:
         """Move a file to its appropriate category folder"""
-        op = FileOperation(source=source, destination=Path(), action="")
+        # Plain strings and os.path keep per-file overhead low; Path objects
+        # are only used at the API boundary
+        op = FileOperation(source=source, destination=None)
         try:
-            category = self._get_file_category(source)
+            if category is None:
+                category = self._get_file_category(source)
+            name = os.path.basename(source)
             target_folder = self._get_target_folder(category)
-            target_path = target_folder / source.name
+            target_path = os.path.join(target_folder, name)
             
-            if not dry_run:
-                target_folder.mkdir(exist_ok=True)
+            if not dry_run and category in self.missing_folders:
+                os.makedirs(target_folder, exist_ok=True)
             
-            if target_path.exists() and target_path != source:
+            if os.path.exists(target_path) and target_path != source:
                 if dry_run:
                     op.destination = target_path
-                    op.action = "Would resolve conflict"
+                    op.action = Action.WOULD_RESOLVE_CONFLICT
                     return op
                 
                 resolution = self._resolve_conflict(source, target_path)
                 
                 if resolution == ConflictResolution.RENAME:
-                    counter = 1
-                    while True:
-                        new_name = f"{source.stem}_{counter}{source.suffix}"
-                        new_target = target_folder / new_name
-                        if not new_target.exists():
-                            target_path = new_target
-                            break
-                        counter += 1
-                    op.action = "Renamed"
+                    target_path = os.path.join(target_folder, self._unique_name(target_folder, name))
+                    op.action = Action.RENAMED
                 elif resolution == ConflictResolution.OVERWRITE:
-                    source_hash = self._calculate_hash(source)
-                    target_hash = self._calculate_hash(target_path)
-                    if source_hash == target_hash:
-                        op.action = "Skipped (identical)"
+                    if self._is_identical(source, target_path):
+                        op.action = Action.SKIPPED_IDENTICAL
                         op.destination = target_path
                         return op
-                    op.action = "Overwritten"
+                    op.action = Action.OVERWRITTEN
                 elif resolution == ConflictResolution.SKIP:
-                    op.action = "Skipped"
+                    op.action = Action.SKIPPED
                     op.destination = target_path
                     return op
             
             op.destination = target_path
-            op.action = "Moved"
+            if op.action is None:
+                op.action = Action.MOVED
             
             if not dry_run:
-                shutil.move(str(source), str(target_path))
+                self._transfer_file(source, target_path)
                 op.success = True
+                self._add_folder_name(target_folder, os.path.basename(target_path))
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(f"{op.action.value} {source} -> {target_path}")
         except Exception as e:
             op.error = str(e)
             self.logger.error(f"Failed to move {source}: {str(e)}")
         finally:
             return op
 
-    def organize(self, dry_run: bool = False, parallel: bool = True):
+    def _process_concurrently(self, files_to_process: List[str],
+                              categories: List[FileCategory], dry_run: bool,
+                              report, max_workers: int):
+        """Move files on a thread pool, recording them in submission order"""
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = deque()
+            for file, category in zip(files_to_process, categories):
+                pending.append(executor.submit(self._move_file, file, dry_run, category))
+                # Bound the number of finished operations held in memory
+                if len(pending) >= max_workers * 4:
+                    self._record_operation(pending.popleft().result(), report)
+            while pending:
+                self._record_operation(pending.popleft().result(), report)
+
+    def organize(self, dry_run: bool = False, parallel: bool = True, use_async: bool = False):
         """Organize files in the base directory"""
         if not self.base_dir.exists():
             raise FileOrganizerError(f"Directory {self.base_dir} does not exist")
         
         self.stats.start_time = time.time()
-        files_to_process = [
-            f for f in self.base_dir.iterdir() 
-            if f.is_file() and not f.name.startswith('.')
-        ]
+        # scandir reports the file type from the directory listing itself, so
+        # no per-file stat is needed. The report file is skipped in case it
+        # lives in the directory being organized.
+        report_path = str(self.report_file)
+        with os.scandir(self.base_dir) as entries:
+            files_to_process = [
+                entry.path
+                for entry in entries
+                if entry.is_file(follow_symlinks=False) and not entry.name.startswith('.')
+                and entry.path != report_path
+            ]
+        categories = self._categorize_files(os.path.basename(file) for file in files_to_process)
         self.stats.total_files = len(files_to_process)
         
         self.logger.info(f"Starting organization of {self.stats.total_files} files in {self.base_dir}")
         
+        # Operations are streamed to the report file instead of kept in memory
         try:
-            if parallel:
-                with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-                    futures = [
-                        executor.submit(self._move_file, file, dry_run)
-                        for file in files_to_process
-                    ]
-                    for future in futures:
-                        op = future.result()
-                        self._update_stats(op)
-                        self.operations.append(op)
-            else:
-                for file in files_to_process:
-                    op = self._move_file(file, dry_run)
-                    self._update_stats(op)
-                    self.operations.append(op)
+            if not dry_run:
+                self._create_target_folders(set(categories))
+            
+            with open(self.report_file, 'w') as report:
+                if use_async or parallel:
+                    max_workers = ASYNC_CONCURRENCY if use_async else MAX_WORKERS
+                    self._process_concurrently(files_to_process, categories, dry_run,
+                                               report, max_workers)
+                else:
+                    for file, category in zip(files_to_process, categories):
+                        op = self._move_file(file, dry_run, category)
+                        self._record_operation(op, report)
         except KeyboardInterrupt:
             self.logger.info("Operation interrupted by user")
             raise
@@ -273,19 +503,30 @@ class FileOrganizer:
             self.stats.end_time = time.time()
             self._log_summary()
 
+    def _record_operation(self, op: FileOperation, report):
+        """Update statistics and append the operation to the report file"""
+        self._update_stats(op)
+        report.write(json.dumps({
+            'source': op.source,
+            'destination': op.destination,
+            'action': op.action.value if op.action else "",
+            'success': op.success,
+            'error': op.error,
+        }) + "\n")
+
     def _update_stats(self, op: FileOperation):
         """Update statistics based on file operation"""
         self.stats.processed_files += 1
         
         if op.error:
             self.stats.failed_files += 1
-        elif "Skipped" in op.action:
-            self.stats.skipped_files += 1
-        elif "Moved" in op.action or "Overwritten" in op.action or "Renamed" in op.action:
-            self.stats.moved_files += 1
+        else:
+            self.action_counts[op.action] += 1
 
     def _log_summary(self):
         """Log summary of the organization operation"""
+        self.stats.moved_files = sum(self.action_counts[action] for action in MOVED_ACTIONS)
+        self.stats.skipped_files = sum(self.action_counts[action] for action in SKIPPED_ACTIONS)
         duration = self.stats.end_time - self.stats.start_time
         files_per_sec = self.stats.processed_files / duration if duration > 0 else 0
         
@@ -309,14 +550,19 @@ class FileOrganizer:
             "Source", "Destination", "Action", "Status"))
         print("-" * 135)
         
-        for op in self.operations:
-            status = "Success" if op.success else f"Failed: {op.error}" if op.error else "Skipped"
-            print("{:<50} {:<50} {:<15} {:<10}".format(
-                str(op.source)[:48],
-                str(op.destination)[:48] if op.destination else "N/A",
-                op.action[:14],
-                status[:9]
-            ))
+        if not self.report_file.exists():
+            return
+        
+        with open(self.report_file) as report:
+            for line in report:
+                op = json.loads(line)
+                status = "Success" if op['success'] else f"Failed: {op['error']}" if op['error'] else "Skipped"
+                print("{:<50} {:<50} {:<15} {:<10}".format(
+                    op['source'][:48],
+                    op['destination'][:48] if op['destination'] else "N/A",
+                    op['action'][:14],
+                    status[:9]
+                ))
 
 def parse_arguments():
     """Parse command line arguments"""
@@ -345,6 +591,12 @@ def parse_arguments():
         action="store_true",
         help="Process files serially instead of in parallel"
     )
+    parser.add_argument(
+        "-a", "--async",
+        dest="use_async",
+        action="store_true",
+        help=f"Keep up to {ASYNC_CONCURRENCY} moves in flight instead of {MAX_WORKERS}"
+    )
     parser.add_argument(
         "-v", "--verbose",
         action="store_true",
@@ -364,7 +616,8 @@ def main():
         if args.verbose:
             logging.getLogger().setLevel(logging.DEBUG)
         
-        organizer.organize(dry_run=args.dry_run, parallel=not args.serial)
+        organizer.organize(dry_run=args.dry_run, parallel=not args.serial,
+                           use_async=args.use_async)
         organizer.print_report()
         
     except KeyboardInterrupt:
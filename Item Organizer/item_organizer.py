@@ -1,14 +1,32 @@
 import os
 import shutil
+import stat
+import errno
 import logging
+import logging.handlers
+import atexit
+import queue
+import threading
 import sys
 from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass
 import hashlib
+import ctypes
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor
 import argparse
 from datetime import datetime
 
+try:
+    import blake3  # Optional: much faster checksums
+except ImportError:
+    blake3 = None
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
+
 # Constants
 DEFAULT_CATEGORIES = {
     'audios': ['.mp3', '.ogg', '.wav', '.flac', '.aac'],
@@ -22,8 +40,103 @@ DEFAULT_CATEGORIES = {
     'general': []
 }
 
+HASH_CHUNK_SIZE = 2 << 20  # 2MB read buffer for streaming checksums
+SINGLE_SHOT_THRESHOLD = 8 << 20  # Files below 8MB are hashed in one read
+PARALLEL_HASH_THRESHOLD = 64 << 20  # Files above 64MB are hashed in parallel chunks
+PARALLEL_HASH_CHUNK = 8 << 20  # 8MB chunks for parallel hashing
+DEFAULT_CHECKSUM_ALGORITHM = 'blake3' if blake3 else 'sha256'
+HAS_FADVISE = hasattr(os, 'posix_fadvise')  # Not available on Windows/macOS
+FICLONE = 0x40049409  # Linux ioctl for copy-on-write clones
+CLONE_NOFOLLOW = 0x0001  # macOS clonefile(3) flag
+_libc = ctypes.CDLL(None, use_errno=True) if sys.platform == 'darwin' else None
+
+def resolve_checksum_algorithm(algorithm: str) -> str:
+    """Map a configured algorithm name to an available one, falling back to SHA256"""
+    algorithm = algorithm.lower()
+    if algorithm == 'auto':
+        return DEFAULT_CHECKSUM_ALGORITHM
+    if algorithm == 'blake3':
+        if blake3 is None:
+            logging.warning("blake3 is not installed, falling back to sha256")
+            return 'sha256'
+        return algorithm
+    if algorithm not in hashlib.algorithms_available:
+        logging.warning(f"Unknown checksum algorithm '{algorithm}', falling back to sha256")
+        return 'sha256'
+    return algorithm
+
+def new_hash(algorithm: str):
+    """Create a hash object, using the blake3 package when requested"""
+    if algorithm == 'blake3':
+        if blake3 is not None:
+            return blake3.blake3(max_threads=blake3.blake3.AUTO)
+        algorithm = 'sha256'
+    return hashlib.new(algorithm)
+
+def try_reflink(src: str, dst: str) -> bool:
+    """Clone a file copy-on-write (Btrfs, XFS, APFS), returning False if unsupported"""
+    if os.path.exists(dst):
+        return False
+    
+    if _libc is not None:
+        return _libc.clonefile(os.fsencode(src), os.fsencode(dst), CLONE_NOFOLLOW) == 0
+    
+    if fcntl is None:
+        return False
+    
+    try:
+        with open(src, 'rb') as src_file, open(dst, 'xb') as dst_file:
+            try:
+                fcntl.ioctl(dst_file.fileno(), FICLONE, src_file.fileno())
+            except OSError:
+                # EXDEV, EOPNOTSUPP, EINVAL, ...: fall back to a regular copy
+                dst_file.close()
+                os.remove(dst)
+                return False
+    except OSError:
+        return False
+    shutil.copystat(src, dst)
+    return True
+
+def copy_and_remove(src: str, dst: str) -> None:
+    """Copy a file's content (cloning when supported), then delete the source"""
+    # copy2 and clones both preserve the original timestamps
+    if not try_reflink(src, dst):
+        shutil.copy2(src, dst)
+    os.remove(src)
+
+def chunk_digest(algorithm: str, chunk: memoryview) -> bytes:
+    """Return the digest of a single chunk"""
+    hash_algo = new_hash(algorithm)
+    hash_algo.update(chunk)
+    return hash_algo.digest()
+
+def tree_checksum(f, algorithm: str) -> str:
+    """Checksum an open file as fixed-size chunks hashed in parallel
+
+    hashlib releases the GIL while hashing, so chunks are hashed on a thread
+    pool and their digests combined in file order. The result differs from a
+    plain checksum and is only meant for comparing files with each other.
+    """
+    workers = os.cpu_count() or 1
+    combined = new_hash(algorithm)
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        while True:
+            chunk = bytearray(PARALLEL_HASH_CHUNK)
+            n = f.readinto(chunk)
+            if not n:
+                break
+            pending.append(executor.submit(chunk_digest, algorithm, memoryview(chunk)[:n]))
+            # Bound the number of chunks held in memory
+            if len(pending) >= workers * 2:
+                combined.update(pending.popleft().result())
+        while pending:
+            combined.update(pending.popleft().result())
+    return combined.hexdigest()
+
 # Data Classes
-@dataclass
+@dataclass(slots=True)
 class FileInfo:
     name: str
     path: str
@@ -31,17 +144,41 @@ class FileInfo:
     modified_time: float
     created_time: float
     checksum: Optional[str] = None
+    is_symlink: bool = False
 
     @property
     def extension(self) -> str:
         return os.path.splitext(self.name)[1].lower()
 
-    def calculate_checksum(self, algorithm='md5', chunk_size=8192) -> None:
-        """Calculate file checksum using specified algorithm"""
-        hash_algo = hashlib.new(algorithm)
-        with open(self.path, 'rb') as f:
-            while chunk := f.read(chunk_size):
-                hash_algo.update(chunk)
+    def calculate_checksum(self, algorithm=DEFAULT_CHECKSUM_ALGORITHM, chunk_size=HASH_CHUNK_SIZE,
+                           buffer: Optional[bytearray] = None) -> None:
+        """Calculate file checksum using specified algorithm.
+
+        A pre-allocated buffer may be passed in to be reused across files.
+        """
+        hash_algo = new_hash(algorithm)
+        if self.size < SINGLE_SHOT_THRESHOLD:
+            with open(self.path, 'rb') as f:
+                hash_algo.update(f.read())
+            self.checksum = hash_algo.hexdigest()
+            return
+
+        # BLAKE3 is multithreaded internally, so only hashlib needs chunking
+        parallel = self.size > PARALLEL_HASH_THRESHOLD and not (algorithm == 'blake3' and blake3)
+        with open(self.path, 'rb', buffering=0) as f:
+            # Ask for aggressive read-ahead, then drop the pages once hashed
+            if HAS_FADVISE:
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            try:
+                if parallel:
+                    self.checksum = tree_checksum(f, algorithm)
+                    return
+                view = memoryview(buffer if buffer is not None else bytearray(chunk_size))
+                while n := f.readinto(view):
+                    hash_algo.update(view[:n])
+            finally:
+                if HAS_FADVISE:
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
         self.checksum = hash_algo.hexdigest()
 
 class DirectoryManager:
@@ -70,27 +207,51 @@ class DirectoryManager:
 class FileOrganizer:
     """Main file organization class with industrial-grade features"""
     
-    def __init__(self, source_path: str, destination_path: str, config: Optional[Dict] = None):
+    def __init__(self, source_path: str, destination_path: str, config: Optional[Dict] = None,
+                 checksum_algorithm: str = 'auto'):
         self.source_path = os.path.abspath(source_path)
         self.destination_path = os.path.abspath(destination_path)
-        self.categories = config if config else DEFAULT_CATEGORIES
+        self.categories = {
+            category: frozenset(sys.intern(ext) for ext in extensions)
+            for category, extensions in (config if config else DEFAULT_CATEGORIES).items()
+        }
+        self.ext_to_category = {}
+        for category, extensions in self.categories.items():
+            for ext in extensions:
+                # First category wins when an extension is listed twice
+                self.ext_to_category.setdefault(ext, category)
         self.file_counters = {category: 0 for category in self.categories}
         self.error_count = 0
         self.skip_count = 0
         self.overwrite_count = 0
+        self.folder_names: Dict[str, set] = {}
+        self.thread_local = threading.local()
         self.log_file = os.path.join(destination_path, 'file_organizer.log')
         self.setup_logging()
+        self.checksum_algorithm = resolve_checksum_algorithm(checksum_algorithm)
     
     def setup_logging(self) -> None:
-        """Configure logging with both console and file output"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(self.log_file),
-                logging.StreamHandler()
-            ]
-        )
+        """Configure logging with both console and file output
+        
+        Worker threads only enqueue records; a single listener thread writes
+        them to the log file and console.
+        """
+        if logging.getLogger().handlers:
+            return
+        
+        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+        handlers = [logging.FileHandler(self.log_file), logging.StreamHandler()]
+        for handler in handlers:
+            handler.setFormatter(formatter)
+        
+        log_queue = queue.Queue()
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setFormatter(logging.Formatter('%(message)s'))
+        logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
+        
+        listener = logging.handlers.QueueListener(log_queue, *handlers)
+        listener.start()
+        atexit.register(listener.stop)
     
     def validate_paths(self) -> bool:
         """Validate source and destination paths"""
@@ -130,24 +291,38 @@ class FileOrganizer:
             logging.error(f"Failed to prepare destination: {str(e)}")
             raise
     
+    def hash_buffer(self) -> bytearray:
+        """Return the calling thread's reusable checksum buffer"""
+        buffer = getattr(self.thread_local, 'buffer', None)
+        if buffer is None:
+            buffer = self.thread_local.buffer = bytearray(HASH_CHUNK_SIZE)
+        return buffer
+    
     def get_file_info(self, file_name: str) -> Optional[FileInfo]:
         """Get detailed file information"""
         file_path = os.path.join(self.source_path, file_name)
         try:
-            if os.path.isfile(file_path):
-                stat = os.stat(file_path)
-                file_info = FileInfo(
-                    name=file_name,
-                    path=file_path,
-                    size=stat.st_size,
-                    modified_time=stat.st_mtime,
-                    created_time=stat.st_ctime
-                )
-                # Only calculate checksum for files larger than 1MB
-                if file_info.size > 1024 * 1024:
-                    file_info.calculate_checksum()
-                return file_info
-            return None
+            file_stat = os.lstat(file_path)
+            is_symlink = stat.S_ISLNK(file_stat.st_mode)
+            if is_symlink:
+                # Links to files are organized by copying their target's content
+                if not os.path.isfile(file_path):
+                    return None
+                file_stat = os.stat(file_path)
+            if not stat.S_ISREG(file_stat.st_mode):
+                return None
+            file_info = FileInfo(
+                name=file_name,
+                path=file_path,
+                size=file_stat.st_size,
+                modified_time=file_stat.st_mtime,
+                created_time=file_stat.st_ctime,
+                is_symlink=is_symlink
+            )
+            # Only calculate checksum for files larger than 1MB
+            if file_info.size > 1024 * 1024:
+                file_info.calculate_checksum(self.checksum_algorithm, buffer=self.hash_buffer())
+            return file_info
         except (OSError, PermissionError) as e:
             logging.warning(f"Could not access file {file_name}: {str(e)}")
             self.error_count += 1
@@ -155,24 +330,31 @@ class FileOrganizer:
     
     def categorize_file(self, file_info: FileInfo) -> str:
         """Determine the category for a file based on its extension"""
-        for category, extensions in self.categories.items():
-            if file_info.extension in extensions:
-                return category
-        return 'general'
+        return self.ext_to_category.get(file_info.extension, 'general')
     
     def handle_file_conflict(self, dest_path: str, file_info: FileInfo) -> bool:
         """
         Handle file naming conflicts with multiple resolution strategies
         Returns True if file should be overwritten/moved, False if skipped
         """
-        if not os.path.exists(dest_path):
+        try:
+            dest_stat = os.stat(dest_path)
+        except FileNotFoundError:
             return True
         
-        # Compare files
-        dest_file_info = self.get_file_info(os.path.basename(dest_path))
-        if dest_file_info and file_info.checksum and dest_file_info.checksum:
+        # Compare files, skipping the checksum when sizes already differ
+        if file_info.checksum and dest_stat.st_size == file_info.size:
+            dest_file_info = FileInfo(
+                name=os.path.basename(dest_path),
+                path=dest_path,
+                size=dest_stat.st_size,
+                modified_time=dest_stat.st_mtime,
+                created_time=dest_stat.st_ctime
+            )
+            dest_file_info.calculate_checksum(self.checksum_algorithm, buffer=self.hash_buffer())
             if file_info.checksum == dest_file_info.checksum:
-                logging.info(f"Duplicate file detected (same checksum): {file_info.name}")
+                if logging.getLogger().isEnabledFor(logging.DEBUG):
+                    logging.debug(f"Duplicate file detected (same checksum): {file_info.name}")
                 self.skip_count += 1
                 return False
         
@@ -180,15 +362,18 @@ class FileOrganizer:
         resolution = 'rename'  # or 'overwrite', 'skip'
         
         if resolution == 'rename':
+            # Probe against a snapshot of the folder instead of one stat per candidate
+            dest_dir = os.path.dirname(dest_path)
+            existing = self.folder_names.get(dest_dir)
+            if existing is None:
+                existing = self.folder_names[dest_dir] = set(os.listdir(dest_dir))
             base, ext = os.path.splitext(file_info.name)
             counter = 1
-            while True:
-                new_name = f"{base}_{counter}{ext}"
-                new_path = os.path.join(os.path.dirname(dest_path), new_name)
-                if not os.path.exists(new_path):
-                    file_info.name = new_name
-                    return True
+            while (new_name := f"{base}_{counter}{ext}") in existing:
                 counter += 1
+            existing.add(new_name)
+            file_info.name = new_name
+            return True
         elif resolution == 'overwrite':
             self.overwrite_count += 1
             return True
@@ -203,17 +388,27 @@ class FileOrganizer:
         
         if not self.handle_file_conflict(dest_path, file_info):
             return False
+        # The conflict handler may have renamed the file
+        dest_path = os.path.join(dest_dir, file_info.name)
         
         try:
-            # Use copy + delete for more reliable moving
-            shutil.copy2(file_info.path, dest_path)
-            os.remove(file_info.path)
-            
-            # Preserve original timestamps
-            os.utime(dest_path, (file_info.created_time, file_info.modified_time))
+            if file_info.is_symlink:
+                # Renaming would move the link itself and break relative targets
+                copy_and_remove(file_info.path, dest_path)
+            else:
+                try:
+                    # Same filesystem: a rename only updates metadata
+                    os.replace(file_info.path, dest_path)
+                except OSError as e:
+                    if e.errno != errno.EXDEV:
+                        raise
+                    copy_and_remove(file_info.path, dest_path)
             
             self.file_counters[category] += 1
-            logging.info(f"Moved {file_info.name} to {category}")
+            if dest_dir in self.folder_names:
+                self.folder_names[dest_dir].add(file_info.name)
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug(f"Moved {file_info.name} to {category}")
             return True
         except Exception as e:
             logging.error(f"Failed to move {file_info.name}: {str(e)}")
@@ -296,6 +491,18 @@ def parse_arguments() -> argparse.Namespace:
         help="Path to JSON configuration file for custom categories"
     )
     
+    parser.add_argument(
+        '--hash-algorithm',
+        help="Checksum algorithm for duplicate detection (auto, blake3, sha256, ...); "
+             "overrides settings.checksum_algorithm in the config"
+    )
+    
+    parser.add_argument(
+        '-v', '--verbose',
+        action='store_true',
+        help="Log every moved or duplicate file"
+    )
+    
     return parser.parse_args()
 
 def main() -> None:
@@ -305,12 +512,22 @@ def main() -> None:
     try:
         # Load custom config if provided
         config = None
+        settings = {}
         if args.config:
             import json
             with open(args.config) as f:
                 config = json.load(f)
+            # Accept both a flat category mapping and the
+            # {"categories": ..., "settings": ...} layout
+            if 'categories' in config:
+                settings = config.get('settings', {})
+                config = config['categories']
+        
+        checksum_algorithm = args.hash_algorithm or settings.get('checksum_algorithm', 'auto')
+        organizer = FileOrganizer(args.source, args.destination, config, checksum_algorithm)
         
-        organizer = FileOrganizer(args.source, args.destination, config)
+        if args.verbose:
+            logging.getLogger().setLevel(logging.DEBUG)
         
         if not organizer.validate_paths():
             sys.exit(1)